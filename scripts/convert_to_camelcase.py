@@ -10,11 +10,27 @@ This script:
 """
 
 import ast
+import functools
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Tuple
 
+from rewrite_common import (
+    RewriteCache,
+    contentHash,
+    loadCacheSection,
+    saveCacheSection,
+    walkPythonFiles,
+)
 
+DEF_KEYWORD_RE = re.compile(r"\bdef\b")
+IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+@functools.cache
 def snakeToCamel(snake_str: str) -> str:
     """
     Convert snake_case to camelCase.
@@ -25,6 +41,9 @@ def snakeToCamel(snake_str: str) -> str:
     Returns:
         String in camelCase
     """
+    if "_" not in snake_str:
+        return snake_str
+
     # Handle private/protected methods (leading underscores)
     leading_underscores = len(snake_str) - len(snake_str.lstrip("_"))
     name_part = snake_str[leading_underscores:]
@@ -82,7 +101,33 @@ class FunctionNameCollector(ast.NodeVisitor):
         self.generic_visit(node)
 
 
-def collectAllFunctionNames(directory: Path) -> Dict[str, str]:
+def collectFunctionNames(content: str, filename: str) -> Dict[str, str]:
+    """
+    Collect function names to convert from a single file's source.
+
+    Names come from the AST, so def lines inside strings and docstrings are
+    ignored and multi-line definitions are handled. Files that never mention
+    def are skipped without parsing.
+
+    Args:
+        content: Python source code
+        filename: Filename used in syntax error messages
+
+    Returns:
+        Dict mapping old_name -> new_name
+    """
+    if not DEF_KEYWORD_RE.search(content):
+        return {}
+
+    tree = compile(content, filename, "exec", flags=ast.PyCF_ONLY_AST, optimize=2)
+    collector = FunctionNameCollector()
+    collector.visit(tree)
+    return collector.functions
+
+
+def collectAllFunctionNames(
+    directory: Path,
+) -> Tuple[Dict[str, str], Dict[Path, str], Dict[Path, str]]:
     """
     Scan all Python files and collect function names to convert.
 
@@ -90,84 +135,156 @@ def collectAllFunctionNames(directory: Path) -> Dict[str, str]:
         directory: Root directory to scan
 
     Returns:
-        Dict mapping old_name -> new_name
+        Tuple of (dict mapping old_name -> new_name, dict mapping file -> content,
+        dict mapping file -> content hash). The contents and hashes are reused by
+        the replacement step so each file is read and hashed once.
     """
     all_functions = {}
+    sources = {}
+    digests = {}
 
-    for py_file in directory.rglob("*.py"):
+    # Names found per content hash on previous runs; unchanged files skip the scan
+    known_names = loadCacheSection("convert_to_camelcase.names")
+    collected_names = {}
+
+    for path in walkPythonFiles(directory):
+        py_file = Path(path)
         try:
-            with open(py_file, encoding="utf-8") as f:
-                content = f.read()
+            data = py_file.read_bytes()
+            content = data.decode("utf-8")
+            sources[py_file] = content
 
-            tree = ast.parse(content, filename=str(py_file))
-            collector = FunctionNameCollector()
-            collector.visit(tree)
+            digest = contentHash(data)
+            digests[py_file] = digest
+            functions = known_names.get(digest)
+            if functions is None:
+                functions = collectFunctionNames(content, str(py_file))
+            collected_names[digest] = functions
 
-            all_functions.update(collector.functions)
+            all_functions.update(functions)
 
         except SyntaxError as e:
             print(f"⚠️  Syntax error in {py_file}: {e}")
         except Exception as e:
             print(f"⚠️  Error processing {py_file}: {e}")
 
-    return all_functions
+    saveCacheSection("convert_to_camelcase.names", collected_names)
+
+    return all_functions, sources, digests
 
 
-def replaceFunctionNames(filepath: Path, replacements: Dict[str, str]) -> Tuple[int, List[str]]:
+def buildTrieRegex(names: Iterable[str]) -> str:
+    """
+    Build a regex alternation for a set of literal names with shared prefixes factored out.
+
+    For example get_client, get_api and get_item give get_(?:api|client|item), so
+    the regex engine walks each common prefix once instead of once per name.
+    Optional suffixes are greedy, so longer names are tried before their prefixes.
+
+    Args:
+        names: Literal names to match
+
+    Returns:
+        Regex source (without anchors or boundaries)
+    """
+    trie: Dict[str, dict] = {}
+    for name in names:
+        node = trie
+        for char in name:
+            node = node.setdefault(char, {})
+        node[""] = {}  # end-of-name marker
+
+    def toRegex(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + toRegex(child) for char, child in sorted(node.items()) if char
+        ]
+        if not branches:
+            return ""
+        is_end = "" in node
+        if len(branches) == 1 and not is_end:
+            return branches[0]
+        group = "(?:" + "|".join(branches) + ")"
+        return group + "?" if is_end else group
+
+    return toRegex(trie)
+
+
+def buildReplacementPattern(replacements: Dict[str, str]) -> re.Pattern:
+    """
+    Build a single regex matching every renameable name in one pass.
+
+    A name is only renamed in definitions (def/async def), decorators (@name),
+    calls (name( / .name() and assignments (name = ...).
+
+    Args:
+        replacements: Dict of old_name -> new_name
+
+    Returns:
+        Compiled pattern with pre, name and post groups
+    """
+    alternation = buildTrieRegex(replacements)
+    return re.compile(rf"(?P<pre>\bdef\s+|@)?\b(?P<name>{alternation})\b(?P<post>\(|\s*=(?!=))?")
+
+
+def replaceFunctionNames(
+    filepath: Path,
+    content: str,
+    replacements: Dict[str, str],
+    clean_hashes: FrozenSet[str] = frozenset(),
+    pattern: re.Pattern | None = None,
+    digest: str | None = None,
+) -> Tuple[int, List[str], str | None]:
     """
     Replace function names in a file.
 
     Args:
         filepath: Path to Python file
+        content: Current content of the file
         replacements: Dict of old_name -> new_name
+        clean_hashes: Content hashes already rewritten by a previous run (skipped)
+        pattern: Result of buildReplacementPattern(replacements); built if not given.
+            Pass it when processing many files so it is built only once.
+        digest: contentHash of the file's raw bytes, if already known from
+            collection; computed from content if not given.
 
     Returns:
-        Tuple of (number of replacements, list of changes)
+        Tuple of (number of replacements, list of changes, hash of resulting content)
     """
     try:
-        with open(filepath, encoding="utf-8") as f:
-            content = f.read()
-
-        original_content = content
-        changes = []
-
-        # Sort by length (longest first) to avoid partial replacements
-        sorted_replacements = sorted(replacements.items(), key=lambda x: len(x[0]), reverse=True)
-
-        for old_name, new_name in sorted_replacements:
-            # Pattern to match function definitions and calls
-            # Matches: def old_name(, self.old_name(, obj.old_name(, old_name(
-            patterns = [
-                (rf"\bdef {re.escape(old_name)}\b", f"def {new_name}"),
-                (rf"\basync def {re.escape(old_name)}\b", f"async def {new_name}"),
-                (rf"\.{re.escape(old_name)}\(", f".{new_name}("),
-                (rf"\b{re.escape(old_name)}\(", f"{new_name}("),
-                # Also match assignments like: some_func = other_func
-                (rf"\b{re.escape(old_name)}\s*=\s*", f"{new_name} = "),
-                # Match in decorators
-                (rf"@{re.escape(old_name)}\b", f"@{new_name}"),
-            ]
-
-            for pattern, replacement in patterns:
-                matches = re.findall(pattern, content)
-                if matches:
-                    old_content = content
-                    content = re.sub(pattern, replacement, content)
-                    if content != old_content:
-                        if old_name not in [c[0] for c in changes]:
-                            changes.append((old_name, new_name, len(matches)))
+        if digest is None:
+            digest = contentHash(content.encode("utf-8"))
+        if digest in clean_hashes:
+            return (0, [], digest)
+
+        # Cheap prefilter: most files mention none of the names being renamed
+        if replacements.keys().isdisjoint(IDENTIFIER_RE.findall(content)):
+            return (0, [], digest)
+
+        if pattern is None:
+            pattern = buildReplacementPattern(replacements)
+        counts: Dict[str, int] = {}
+
+        def replace(match: re.Match) -> str:
+            if match["pre"] is None and match["post"] is None:
+                return match[0]
+            old_name = match["name"]
+            counts[old_name] = counts.get(old_name, 0) + 1
+            return f"{match['pre'] or ''}{replacements[old_name]}{match['post'] or ''}"
+
+        new_content = pattern.sub(replace, content)
 
         # Only write if changes were made
-        if content != original_content:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(content)
-            return (len(changes), changes)
+        if counts:
+            new_data = new_content.encode("utf-8")
+            filepath.write_bytes(new_data)
+            changes = [(name, replacements[name], count) for name, count in counts.items()]
+            return (len(changes), changes, contentHash(new_data))
 
-        return (0, [])
+        return (0, [], digest)
 
     except Exception as e:
         print(f"⚠️  Error processing {filepath}: {e}")
-        return (0, [])
+        return (0, [], None)
 
 
 def main():
@@ -181,7 +298,7 @@ def main():
     print("🔍 Step 1: Collecting all function names...")
     print("=" * 70)
 
-    function_map = collectAllFunctionNames(shadowlib_dir)
+    function_map, sources, digests = collectAllFunctionNames(shadowlib_dir)
 
     if not function_map:
         print("✅ No snake_case functions found - all functions already camelCase!")
@@ -198,23 +315,51 @@ def main():
     print("🔄 Step 2: Converting function names in all files...")
     print("=" * 70)
 
-    python_files = list(shadowlib_dir.rglob("*.py"))
+    python_files = sorted(sources)
     total_files_changed = 0
     total_replacements = 0
-
-    for filepath in sorted(python_files):
-        num_changes, changes = replaceFunctionNames(filepath, function_map)
+    report: List[str] = []
+
+    cache = RewriteCache("convert_to_camelcase", function_map)
+
+    # Files are independent, so rewrite them in parallel and report in sorted order.
+    # Contents and hashes come from collection, so no file is re-read or re-hashed.
+    pattern = buildReplacementPattern(function_map)
+    with ProcessPoolExecutor() as executor:
+        contents = [sources[filepath] for filepath in python_files]
+        known_digests = [digests[filepath] for filepath in python_files]
+        results = list(
+            executor.map(
+                replaceFunctionNames,
+                python_files,
+                contents,
+                repeat(function_map),
+                repeat(frozenset(cache.clean)),
+                repeat(pattern),
+                known_digests,
+                chunksize=16,
+            )
+        )
+
+    for filepath, (num_changes, changes, digest) in zip(python_files, results):
+        if digest is not None:
+            cache.record(digest)
 
         if num_changes > 0:
             total_files_changed += 1
             total_replacements += sum(count for _, _, count in changes)
 
-            print(f"\n📝 {filepath.relative_to(shadowlib_dir.parent)}:")
+            report.append(f"\n📝 {filepath.relative_to(shadowlib_dir.parent)}:\n")
             for old_name, new_name, count in changes[:10]:  # Show first 10
-                print(f"  ✓ {old_name} → {new_name} ({count} occurrences)")
+                report.append(f"  ✓ {old_name} → {new_name} ({count} occurrences)\n")
 
             if len(changes) > 10:
-                print(f"  ... and {len(changes) - 10} more changes")
+                report.append(f"  ... and {len(changes) - 10} more changes\n")
+
+    # Write the per-file report in one call rather than a print per line
+    sys.stdout.write("".join(report))
+
+    cache.save()
 
     print("\n" + "=" * 70)
     print("✅ Conversion complete!")
@@ -232,6 +377,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
-
     sys.exit(main())
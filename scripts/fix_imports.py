@@ -6,9 +6,14 @@ Old structure: shadowlib/osrs/*, shadowlib/runeliteBridge/*
 New structure: shadowlib/tabs/*, shadowlib/_internal/*, etc.
 """
 
+import functools
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Tuple
+from typing import FrozenSet, List, Tuple
+
+from rewrite_common import RewriteCache, contentHash, walkPythonFiles
 
 # Mapping of old import paths to new paths
 IMPORT_REPLACEMENTS = {
@@ -35,42 +40,53 @@ IMPORT_REPLACEMENTS = {
     r"\bgame_state\b": "gameState",
 }
 
+# Compiled once at import time; each entry is (pattern, replacement)
+_COMPILED_REPLACEMENTS = [
+    (re.compile(pattern), replacement) for pattern, replacement in IMPORT_REPLACEMENTS.items()
+]
+
 
-def fixImportsInFile(filepath: Path) -> Tuple[int, List[str]]:
+def fixImportsInFile(
+    filepath: Path, clean_hashes: FrozenSet[str] = frozenset()
+) -> Tuple[int, List[str], str | None]:
     """
     Fix imports in a single Python file.
 
     Args:
         filepath: Path to Python file
+        clean_hashes: Content hashes already fixed by a previous run (skipped)
 
     Returns:
-        Tuple of (number of changes, list of change descriptions)
+        Tuple of (number of changes, list of change descriptions, hash of resulting content)
     """
     try:
-        with open(filepath, encoding="utf-8") as f:
-            content = f.read()
+        data = filepath.read_bytes()
+        digest = contentHash(data)
+        if digest in clean_hashes:
+            return (0, [], digest)
+
+        content = data.decode("utf-8")
 
         original_content = content
         changes = []
 
         # Apply all replacements
-        for old_pattern, new_pattern in IMPORT_REPLACEMENTS.items():
-            matches = re.findall(old_pattern, content)
-            if matches:
-                content = re.sub(old_pattern, new_pattern, content)
-                changes.append(f"  {old_pattern} → {new_pattern} ({len(matches)} occurrences)")
+        for pattern, replacement in _COMPILED_REPLACEMENTS:
+            content, count = pattern.subn(replacement, content)
+            if count:
+                changes.append(f"  {pattern.pattern} → {replacement} ({count} occurrences)")
 
         # Only write if changes were made
         if content != original_content:
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(content)
-            return (len(changes), changes)
+            new_data = content.encode("utf-8")
+            filepath.write_bytes(new_data)
+            return (len(changes), changes, contentHash(new_data))
 
-        return (0, [])
+        return (0, [], digest)
 
     except Exception as e:
         print(f"Error processing {filepath}: {e}")
-        return (0, [])
+        return (0, [], None)
 
 
 def main():
@@ -81,22 +97,35 @@ def main():
         print(f"Error: {shadowlib_dir} not found")
         return 1
 
-    python_files = list(shadowlib_dir.rglob("*.py"))
+    python_files = sorted(Path(path) for path in walkPythonFiles(shadowlib_dir))
     print(f"Found {len(python_files)} Python files")
     print("=" * 60)
 
     total_files_changed = 0
     total_changes = 0
+    report: List[str] = []
+
+    cache = RewriteCache("fix_imports", IMPORT_REPLACEMENTS)
 
-    for filepath in sorted(python_files):
-        num_changes, changes = fixImportsInFile(filepath)
+    # Files are independent, so rewrite them in parallel and report in sorted order
+    worker = functools.partial(fixImportsInFile, clean_hashes=frozenset(cache.clean))
+    with ProcessPoolExecutor() as executor:
+        results = list(executor.map(worker, python_files, chunksize=16))
+
+    for filepath, (num_changes, changes, digest) in zip(python_files, results):
+        if digest is not None:
+            cache.record(digest)
 
         if num_changes > 0:
             total_files_changed += 1
             total_changes += num_changes
-            print(f"\n📝 {filepath.relative_to(shadowlib_dir.parent)}:")
-            for change in changes:
-                print(change)
+            report.append(f"\n📝 {filepath.relative_to(shadowlib_dir.parent)}:\n")
+            report.extend(f"{change}\n" for change in changes)
+
+    # Write the per-file report in one call rather than a print per line
+    sys.stdout.write("".join(report))
+
+    cache.save()
 
     print("\n" + "=" * 60)
     print(f"✅ Fixed {total_changes} imports in {total_files_changed} files")
@@ -105,6 +134,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import sys
-
     sys.exit(main())
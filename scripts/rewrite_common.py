@@ -0,0 +1,139 @@
+"""
+Helpers shared by the rewrite scripts (convert_to_camelcase.py, fix_imports.py).
+
+- walkPythonFiles: fast recursive discovery of .py files
+- RewriteCache: on-disk cache of the SHA-256 of every file as it was left by the
+  last run, per script and per replacement set. On the next run, files whose
+  content still hashes to a recorded value are skipped without any regex work.
+- loadCacheSection / saveCacheSection: raw access to named sections of the same
+  cache file, for scripts that cache other per-file results
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Set
+
+CACHE_DIR = Path(__file__).parent.parent / ".shadowlib-rewrite-cache"
+CACHE_FILE = CACHE_DIR / "_cache.json"
+
+# Bump when a script's rewrite logic changes so stale entries are ignored
+CACHE_VERSION = 2
+
+
+def walkPythonFiles(directory: Path | str) -> Iterator[str]:
+    """
+    Recursively yield paths of .py files under a directory.
+
+    Uses os.scandir, whose entries carry cached file type info, instead of
+    Path.rglob. Symlinked directories are not followed.
+
+    Args:
+        directory: Root directory to scan
+
+    Yields:
+        File paths as strings
+    """
+    pending: List[str] = [os.fspath(directory)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+
+
+def contentHash(data: bytes) -> str:
+    """
+    Hash raw file content for cache lookups.
+
+    Args:
+        data: File content as read from disk
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(data).hexdigest()
+
+
+def _readCacheFile() -> Dict[str, Any]:
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def loadCacheSection(section: str) -> Dict[str, Any]:
+    """
+    Load a named section of the cache file.
+
+    Args:
+        section: Section name
+
+    Returns:
+        The stored section, or an empty dict if missing or written by another CACHE_VERSION
+    """
+    stored = _readCacheFile().get(section, {})
+    if stored.get("version") != CACHE_VERSION:
+        return {}
+    return stored.get("data", {})
+
+
+def saveCacheSection(section: str, value: Dict[str, Any]) -> None:
+    """
+    Replace a named section of the cache file.
+
+    Args:
+        section: Section name
+        value: JSON-serializable section content
+    """
+    data = _readCacheFile()
+    data[section] = {"version": CACHE_VERSION, "data": value}
+
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        CACHE_FILE.write_text(json.dumps(data), encoding="utf-8")
+    except OSError as e:
+        print(f"⚠️  Could not write rewrite cache: {e}")
+
+
+class RewriteCache:
+    """
+    Set of content hashes already processed by one script with one replacement set.
+
+    Example:
+        cache = RewriteCache("fix_imports", IMPORT_REPLACEMENTS)
+        skip = frozenset(cache.clean)  # workers skip content hashing to one of these
+        cache.record(contentHash(new_data))
+        cache.save()
+    """
+
+    def __init__(self, script: str, replacements: Dict[str, str]):
+        """
+        Load the cache section for a script.
+
+        Args:
+            script: Name of the script owning the cache section
+            replacements: Replacement mapping the script applies; any change to it
+                invalidates every recorded hash
+        """
+        self.script = script
+        self.key = hashlib.sha256(
+            json.dumps(replacements, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        self.clean: Set[str] = set()
+        self._seen: Set[str] = set()
+
+        section = loadCacheSection(script)
+        if section.get("key") == self.key:
+            self.clean = set(section.get("hashes", []))
+
+    def record(self, digest: str) -> None:
+        """Record the hash of a file's content after this run."""
+        self._seen.add(digest)
+
+    def save(self) -> None:
+        """Persist hashes recorded this run, replacing the script's previous section."""
+        saveCacheSection(self.script, {"key": self.key, "hashes": sorted(self._seen)})
@@ -3,6 +3,7 @@ OSRS Game Resources System
 
 Provides access to game data (varps, varbits, objects) loaded at initialization.
 Data is downloaded and loaded once per session by cache_manager.ensureResourcesLoaded().
+Submodules are imported lazily on first access.
 
 Example:
     from shadowlib._internal.resources import varps, objects
@@ -16,9 +17,16 @@ Example:
     nearby = objects.getNearby(3222, 3218, 0, radius=10)
 """
 
-from . import objects, varps
+import importlib
 
 __all__ = [
     "varps",
     "objects",
 ]
+
+
+def __getattr__(name: str):
+    """Import resource submodules on first access (PEP 562)."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -96,8 +96,7 @@ class Bank(ItemContainer):
         self.capacity_widget.enable(WidgetFields.getText)
 
         self.item_widget = Widget(client.InterfaceID.Bankmain.ITEMS)
-        self.item_widget.enable(WidgetFields.getBounds)
-        self.item_widget.enable(WidgetFields.isHidden)
+        self.item_widget.enable(WidgetFields.getBounds, WidgetFields.isHidden)
 
     def __init__(self):
         """Override to prevent ItemContainer.__init__ from running."""
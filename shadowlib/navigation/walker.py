@@ -174,7 +174,7 @@ class Walker:
         firstObstacleIdx = path.length()
         for obstacle in path.obstacles:
             # Find where this obstacle's origin is on the path
-            matches = np.where(path.packed == obstacle.origin.packed)[0]
+            matches = np.where(path.packed.view(np.uint32) == obstacle.origin.packed)[0]
             if len(matches) > 0:
                 idx = int(matches[0])
                 if idx < firstObstacleIdx:
@@ -5,9 +5,10 @@ from .circle import Circle
 from .gametab import GameTab, GameTabs
 from .item import Item, ItemIdentifier
 from .itemcontainer import ItemContainer
-from .point import Point, Point3D
+from .point import Point, Point3D, PointArray
 from .polygon import Polygon
 from .quad import Quad
+from .shared import seedRandom
 from .widget import Widget, WidgetField, WidgetFields
 
 __all__ = [
@@ -20,10 +21,12 @@ __all__ = [
     "ItemIdentifier",
     "Point",
     "Point3D",
+    "PointArray",
     "Polygon",
     "Quad",
     "Widget",
     "WidgetField",
     "WidgetFields",
     "createGrid",
+    "seedRandom",
 ]
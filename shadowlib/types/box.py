@@ -1,14 +1,12 @@
 """Box (rectangular area) geometry type."""
 
-import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from shadowlib.types.point import Point
+from shadowlib.types.point import Point
+from shadowlib.types.shared import getMouse, rng
 
 
-@dataclass
+@dataclass(slots=True)
 class Box:
     """
     Represents a rectangular area (axis-aligned box) with integer coordinates.
@@ -108,10 +106,24 @@ class Box:
             >>> box = Box(100, 100, 200, 200)
             >>> center = box.center()  # Point(150, 150)
         """
-        from shadowlib.types.point import Point
-
         return Point((self.x1 + self.x2) // 2, (self.y1 + self.y2) // 2)
 
+    def bounds(self) -> tuple[int, int, int, int]:
+        """
+        Get the bounding box of the points inside this box.
+
+        Maxima are inclusive, like every shape's bounds(). Since contains() treats
+        x2/y2 as exclusive, they are one less than the stored edges.
+
+        Returns:
+            Tuple of (minX, minY, maxX, maxY), i.e. (x1, y1, x2 - 1, y2 - 1)
+
+        Example:
+            >>> box = Box(100, 100, 200, 200)
+            >>> box.bounds()  # (100, 100, 199, 199)
+        """
+        return (self.x1, self.y1, self.x2 - 1, self.y2 - 1)
+
     def contains(self, other: "Point | Box") -> bool:
         """
         Check if a point or box is within this box.
@@ -136,6 +148,28 @@ class Box:
             )
         return self.x1 <= other.x < self.x2 and self.y1 <= other.y < self.y2
 
+    def intersection(self, other: "Box") -> "Box | None":
+        """
+        Get the overlapping region of this box and another.
+
+        Args:
+            other: Box to intersect with
+
+        Returns:
+            Box covering the overlap, or None if the boxes don't overlap
+
+        Example:
+            >>> Box(0, 0, 100, 100).intersection(Box(50, 50, 150, 150))  # Box(50, 50, 100, 100)
+            >>> Box(0, 0, 10, 10).intersection(Box(20, 20, 30, 30))  # None
+        """
+        x1 = self.x1 if self.x1 > other.x1 else other.x1
+        y1 = self.y1 if self.y1 > other.y1 else other.y1
+        x2 = self.x2 if self.x2 < other.x2 else other.x2
+        y2 = self.y2 if self.y2 < other.y2 else other.y2
+        if x1 < x2 and y1 < y2:
+            return Box(x1, y1, x2, y2)
+        return None
+
     def randomPoint(self) -> "Point":
         """
         Generate a random point within this box.
@@ -147,9 +181,7 @@ class Box:
             >>> box = Box(100, 100, 200, 200)
             >>> point = box.randomPoint()  # Random point between (100,100) and (199,199)
         """
-        from shadowlib.types.point import Point
-
-        return Point(random.randrange(self.x1, self.x2), random.randrange(self.y1, self.y2))
+        return Point(rng.randrange(self.x1, self.x2), rng.randrange(self.y1, self.y2))
 
     def click(self, button: str = "left", randomize: bool = True) -> None:
         """
@@ -183,10 +215,7 @@ class Box:
             >>> box.hover()  # Hover at random point
             >>> box.hover(randomize=False)  # Hover at center
         """
-        from shadowlib.globals import getClient
-        from shadowlib.types.point import Point
-
-        current = Point(*getClient().input.mouse.position)
+        current = Point(*getMouse().position)
         if self.contains(current):
             return True
         point = self.randomPoint() if randomize else self.center()
@@ -285,20 +314,12 @@ def createGrid(
         >>> # Create grid with 2px padding to avoid edge clicks
         >>> slots = createGrid(563, 213, 36, 32, columns=4, rows=7, spacingX=6, spacingY=4, padding=2)
     """
-    boxes = []
-    for row in range(rows):
-        for col in range(columns):
-            x1 = startX + col * (width + spacingX)
-            y1 = startY + row * (height + spacingY)
-            x2 = x1 + width
-            y2 = y1 + height
-
-            # Apply padding (shrink box on all sides)
-            if padding > 0:
-                x1 += padding
-                y1 += padding
-                x2 -= padding
-                y2 -= padding
-
-            boxes.append(Box(x1, y1, x2, y2))
-    return boxes
+    # Padding shrinks each box on all sides; non-positive padding leaves boxes as-is
+    pad = padding if padding > 0 else 0
+    innerWidth = width - 2 * pad
+    innerHeight = height - 2 * pad
+
+    # Column/row offsets are computed once, not per cell
+    xs = [startX + pad + col * (width + spacingX) for col in range(columns)]
+    ys = [startY + pad + row * (height + spacingY) for row in range(rows)]
+    return [Box(x1, y1, x1 + innerWidth, y1 + innerHeight) for y1 in ys for x1 in xs]
@@ -1,15 +1,13 @@
 """Circle geometry type."""
 
 import math
-import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from shadowlib.types.point import Point
+from shadowlib.types.point import Point
+from shadowlib.types.shared import getMouse, rng
 
 
-@dataclass
+@dataclass(slots=True)
 class Circle:
     """
     Represents a circle with integer center coordinates and float radius.
@@ -41,8 +39,6 @@ class Circle:
             >>> circle = Circle(100, 100, 50)
             >>> center = circle.center()  # Point(100, 100)
         """
-        from shadowlib.types.point import Point
-
         return Point(self.centerX, self.centerY)
 
     def area(self) -> float:
@@ -58,6 +54,23 @@ class Circle:
         """
         return math.pi * self.radius * self.radius
 
+    def bounds(self) -> tuple[int, int, int, int]:
+        """
+        Get the bounding box of the integer points inside this circle.
+
+        Maxima are inclusive, like every shape's bounds().
+
+        Returns:
+            Tuple of (minX, minY, maxX, maxY)
+
+        Example:
+            >>> circle = Circle(100, 100, 10.5)
+            >>> circle.bounds()  # (90, 90, 110, 110)
+        """
+        # Integer points inside satisfy |dx| <= radius, i.e. |dx| <= floor(radius)
+        r = int(self.radius)
+        return (self.centerX - r, self.centerY - r, self.centerX + r, self.centerY + r)
+
     def contains(self, point: "Point") -> bool:
         """
         Check if a point is within this circle.
@@ -75,7 +88,9 @@ class Circle:
         """
         dx = point.x - self.centerX
         dy = point.y - self.centerY
-        return math.sqrt(dx * dx + dy * dy) <= self.radius
+        # Compare squared distances; no sqrt needed
+        r = self.radius
+        return dx * dx + dy * dy <= r * r
 
     def randomPoint(self) -> "Point":
         """
@@ -90,11 +105,9 @@ class Circle:
             >>> circle = Circle(100, 100, 50)
             >>> point = circle.randomPoint()
         """
-        from shadowlib.types.point import Point
-
         # Use sqrt to get uniform distribution (not just random angle/radius)
-        r = self.radius * math.sqrt(random.random())
-        theta = random.uniform(0, 2 * math.pi)
+        r = self.radius * math.sqrt(rng.random())
+        theta = rng.uniform(0, 2 * math.pi)
 
         x = self.centerX + int(r * math.cos(theta))
         y = self.centerY + int(r * math.sin(theta))
@@ -131,10 +144,7 @@ class Circle:
             >>> circle = Circle(100, 100, 50)
             >>> circle.hover()  # Hover at random point
         """
-        from shadowlib.globals import getClient
-        from shadowlib.types.point import Point
-
-        current = Point(*getClient().input.mouse.position)
+        current = Point(*getMouse().position)
         if self.contains(current):
             return True
         point = self.randomPoint() if randomize else self.center()
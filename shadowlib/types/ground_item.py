@@ -93,7 +93,7 @@ class GroundItem:
         Returns:
             Distance in tiles (Chebyshev distance)
         """
-        player_pos = PackedPosition(
+        player_pos = PackedPosition.unchecked(
             self.client.player.x, self.client.player.y, self.client.player.plane
         )
         return self.position.distanceTo(player_pos)
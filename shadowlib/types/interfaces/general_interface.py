@@ -3,10 +3,24 @@ from shadowlib.client import client
 from shadowlib.types.box import Box
 from shadowlib.types.widget import Widget, WidgetFields
 
+# Default for widgets without bounds; shared to avoid a list allocation per lookup
+_ZERO_BOUNDS = (0, 0, 0, 0)
+
 
 class GeneralInterface:
     """Interface class with optional scrollbox support."""
 
+    __slots__ = (
+        "group",
+        "get_children",
+        "wrong_text",
+        "menu_text",
+        "scrollbox",
+        "max_scroll",
+        "use_actions",
+        "buttons",
+    )
+
     def __init__(
         self,
         group: int,
@@ -27,15 +41,9 @@ class GeneralInterface:
         self.use_actions = use_actions
         self.buttons: list[Widget] = []
 
+        label_field = WidgetFields.getActions if use_actions else WidgetFields.getText
         for id in button_ids:
-            w = (
-                Widget(id)
-                .enable(WidgetFields.getBounds)
-                .enable(
-                    WidgetFields.getActions if use_actions else WidgetFields.getText,
-                )
-            )
-            self.buttons.append(w)
+            self.buttons.append(Widget(id).enable(WidgetFields.getBounds, label_field))
 
     def getWidgetInfo(self) -> list:
         return (
@@ -59,7 +67,7 @@ class GeneralInterface:
     def _getScrollbox(self) -> Box | None:
         if not self.scrollbox:
             return None
-        b = Widget(self.scrollbox).enable(WidgetFields.getBounds).get().get("bounds", [0, 0, 0, 0])
+        b = Widget(self.scrollbox).enable(WidgetFields.getBounds).get().get("bounds", _ZERO_BOUNDS)
         return Box.fromRect(*b) if b[2] > 0 and b[3] > 0 else None
 
     def _scroll(self, sb: Box, up: bool = False) -> None:
@@ -80,18 +88,20 @@ class GeneralInterface:
 
     def _makeVisible(self, text: str, idx: int, sb: Box | None) -> Box | None:
         """Find option and scroll until visible. Returns clickable Box or None."""
-        w = self._findWidget(text, idx)
-        if not w:
-            return None
-
-        for _ in range(self.max_scroll + 1):
-            b = w.get("bounds", [0, 0, 0, 0])
-            if b[2] > 0 and b[3] > 0:
-                box = Box.fromRect(*b)
-                if not sb or sb.contains(box):
-                    return box
-                self._scroll(sb, up=box.y1 < sb.y1)
+        for attempt in range(self.max_scroll + 1):
+            # One fetch per attempt; only scroll when another attempt will check the result
             w = self._findWidget(text, idx)
+            if not w:
+                return None
+            x, y, width, height = w.get("bounds", _ZERO_BOUNDS)
+            if width > 0 and height > 0:
+                # Compare raw bounds; only build a Box once the widget is visible
+                if not sb or (
+                    sb.x1 <= x and x + width <= sb.x2 and sb.y1 <= y and y + height <= sb.y2
+                ):
+                    return Box.fromRect(x, y, width, height)
+                if attempt < self.max_scroll:
+                    self._scroll(sb, up=y < sb.y1)
         return None
 
     def interact(self, option_text: str = "", index: int = -1) -> bool:
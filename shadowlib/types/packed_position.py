@@ -11,17 +11,21 @@ Java packing: (x & 0x7FFF) | ((y & 0x7FFF) << 15) | ((plane & 0x3) << 30)
 
 from typing import Tuple
 
+import numpy as np
 
-class PackedPosition:
+
+class PackedPosition(int):
     """
     Efficient packed position representation for OSRS coordinates.
 
-    Internally stores (x, y, plane) as a single 32-bit integer.
+    A PackedPosition *is* its packed 32-bit integer: hashing and equality
+    use the C int implementation, so positions are cheap dict/set keys and
+    compare equal to the raw packed value.
     """
 
-    __slots__ = ("_packed",)
+    __slots__ = ()
 
-    def __init__(self, x: int = 0, y: int = 0, plane: int = 0):
+    def __new__(cls, x: int = 0, y: int = 0, plane: int = 0):
         """
         Create a packed position.
 
@@ -30,14 +34,31 @@ class PackedPosition:
             y: Y coordinate (0-32767)
             plane: Plane level (0-3)
         """
-        if not (0 <= x <= 32767):
-            raise ValueError(f"X out of range: {x} (must be 0-32767)")
-        if not (0 <= y <= 32767):
-            raise ValueError(f"Y out of range: {y} (must be 0-32767)")
-        if not (0 <= plane <= 3):
-            raise ValueError(f"Plane out of range: {plane} (must be 0-3)")
+        # Any bit outside the field width (including the sign of a negative) is out of range
+        if (x | y) & ~0x7FFF or plane & ~0x3:
+            raise ValueError(
+                f"Position out of range: ({x}, {y}, {plane}) (x/y must be 0-32767, plane 0-3)"
+            )
 
-        self._packed = (x & 0x7FFF) | ((y & 0x7FFF) << 15) | ((plane & 0x3) << 30)
+        return int.__new__(cls, (x & 0x7FFF) | ((y & 0x7FFF) << 15) | ((plane & 0x3) << 30))
+
+    @classmethod
+    def unchecked(cls, x: int, y: int, plane: int) -> "PackedPosition":
+        """
+        Create a packed position without range checks.
+
+        For trusted coordinates (e.g. read from the game). Out-of-range bits
+        are masked off like packPosition() does.
+
+        Args:
+            x: X coordinate (0-32767)
+            y: Y coordinate (0-32767)
+            plane: Plane level (0-3)
+
+        Returns:
+            PackedPosition instance
+        """
+        return int.__new__(cls, (x & 0x7FFF) | ((y & 0x7FFF) << 15) | ((plane & 0x3) << 30))
 
     @classmethod
     def fromPacked(cls, packed: int) -> "PackedPosition":
@@ -45,34 +66,70 @@ class PackedPosition:
         Create from a packed integer.
 
         Args:
-            packed: Packed 32-bit position integer
+            packed: Packed 32-bit position integer (signed or unsigned)
 
         Returns:
             PackedPosition instance
         """
-        pos = cls.__new__(cls)
-        pos._packed = packed
-        return pos
+        # Normalize signed packs (planes 2-3) so equality/hashing match the unsigned value.
+        # int() first: masking a NumPy int32 scalar with 0xFFFFFFFF overflows
+        return int.__new__(cls, int(packed) & 0xFFFFFFFF)
+
+    @classmethod
+    def toArray(cls, positions) -> np.ndarray:
+        """
+        Convert a collection of positions to a packed uint32 array.
+
+        Args:
+            positions: Iterable of PackedPosition (or packed ints, signed or unsigned)
+
+        Returns:
+            uint32 array of packed positions, for the vectorized helpers
+
+        Example:
+            >>> arr = PackedPosition.toArray(visited_tiles)
+            >>> mask = PackedPosition.nearbyMask(arr, player_pos, 10)
+        """
+        # A known length lets fromiter preallocate instead of growing the buffer
+        count = len(positions) if hasattr(positions, "__len__") else -1
+        # int64 holds both signed and unsigned packs; the cast wraps signed ones to unsigned
+        return np.fromiter(positions, dtype=np.int64, count=count).astype(np.uint32)
+
+    @classmethod
+    def fromArray(cls, packed) -> list["PackedPosition"]:
+        """
+        Convert an array of packed integers to PackedPosition instances.
+
+        Args:
+            packed: Packed positions (signed or unsigned), array-like
+
+        Returns:
+            List of PackedPosition
+        """
+        # Normalize signed values so positions hash/compare like unsigned packs
+        values = np.asarray(packed).astype(np.uint32, copy=False).tolist()
+        new = int.__new__
+        return [new(cls, p) for p in values]
 
     @property
     def x(self) -> int:
         """Get X coordinate (bits 0-14)."""
-        return self._packed & 0x7FFF
+        return self & 0x7FFF
 
     @property
     def y(self) -> int:
         """Get Y coordinate (bits 15-29)."""
-        return (self._packed >> 15) & 0x7FFF
+        return (self >> 15) & 0x7FFF
 
     @property
     def plane(self) -> int:
         """Get plane level."""
-        return (self._packed >> 30) & 0x3
+        return (self >> 30) & 0x3
 
     @property
     def packed(self) -> int:
-        """Get packed integer representation."""
-        return self._packed
+        """Get packed integer representation (as a plain int)."""
+        return int(self)
 
     def unpack(self) -> Tuple[int, int, int]:
         """
@@ -81,7 +138,7 @@ class PackedPosition:
         Returns:
             Tuple of (x, y, plane)
         """
-        return (self.x, self.y, self.plane)
+        return (self & 0x7FFF, (self >> 15) & 0x7FFF, (self >> 30) & 0x3)
 
     def distanceTo(self, other: "PackedPosition") -> int:
         """
@@ -93,9 +150,14 @@ class PackedPosition:
         Returns:
             Distance in tiles (max of dx, dy)
         """
-        dx = abs(self.x - other.x)
-        dy = abs(self.y - other.y)
-        return max(dx, dy)
+        # Mask the packed ints directly and avoid abs()/max() builtin calls
+        dx = (self & 0x7FFF) - (other & 0x7FFF)
+        dy = ((self >> 15) & 0x7FFF) - ((other >> 15) & 0x7FFF)
+        if dx < 0:
+            dx = -dx
+        if dy < 0:
+            dy = -dy
+        return dx if dx > dy else dy
 
     def isNearby(self, other: "PackedPosition", radius: int, same_plane: bool = True) -> bool:
         """
@@ -109,24 +171,79 @@ class PackedPosition:
         Returns:
             True if within radius
         """
-        if same_plane and self.plane != other.plane:
+        # Plane bits differ -> different planes
+        if same_plane and ((self ^ other) >> 30) & 0x3:
+            return False
+
+        # Bounding-box test; the chained comparison exits on the first miss
+        dx = (self & 0x7FFF) - (other & 0x7FFF)
+        if not -radius <= dx <= radius:
             return False
+        dy = ((self >> 15) & 0x7FFF) - ((other >> 15) & 0x7FFF)
+        return -radius <= dy <= radius
+
+    def distancesToMany(self, packed) -> np.ndarray:
+        """
+        Calculate Chebyshev distance to each of many positions (vectorized).
+
+        Args:
+            packed: Packed positions (signed or unsigned), array-like
 
-        return self.distanceTo(other) <= radius
+        Returns:
+            int32 array of distances in tiles, ignoring plane
+
+        Example:
+            >>> dist = player_pos.distancesToMany(npc_positions)
+            >>> closest = npc_positions[dist.argmin()]
+        """
+        packed = np.asarray(packed).astype(np.uint32, copy=False)
+        dx = (packed & 0x7FFF).astype(np.int32) - (self & 0x7FFF)
+        dy = ((packed >> 15) & 0x7FFF).astype(np.int32) - ((self >> 15) & 0x7FFF)
+        return np.maximum(np.abs(dx), np.abs(dy))
+
+    @classmethod
+    def nearbyMask(
+        cls, packed, center: "PackedPosition", radius: int, same_plane: bool = True
+    ) -> np.ndarray:
+        """
+        Vectorized isNearby() over an array of packed positions.
 
-    def __eq__(self, other) -> bool:
-        if isinstance(other, PackedPosition):
-            return self._packed == other._packed
-        return False
+        Args:
+            packed: Packed positions (signed or unsigned), array-like
+            center: Position to measure from
+            radius: Maximum distance in tiles
+            same_plane: If True, positions must be on center's plane
 
-    def __hash__(self) -> int:
-        return self._packed
+        Returns:
+            Boolean array, True where the position is within radius
+
+        Example:
+            >>> mask = PackedPosition.nearbyMask(npc_positions, player_pos, 5)
+            >>> nearby = npc_positions[mask]
+        """
+        packed = np.asarray(packed).astype(np.uint32, copy=False)
+        mask = center.distancesToMany(packed) <= radius
+        if same_plane:
+            # Compare the plane bits in place rather than extracting a plane array
+            mask &= (packed & 0xC0000000) == (center & 0xC0000000)
+        return mask
+
+    def __bool__(self) -> bool:
+        # A position is always truthy, even the origin tile (which packs to 0)
+        return True
+
+    def __reduce__(self):
+        # int's default pickling would call __new__ with the packed value as x
+        return (PackedPosition.fromPacked, (int(self),))
 
     def __repr__(self) -> str:
-        return f"PackedPosition(x={self.x}, y={self.y}, plane={self.plane})"
+        return (
+            f"PackedPosition(x={self & 0x7FFF}, y={(self >> 15) & 0x7FFF}, "
+            f"plane={(self >> 30) & 0x3})"
+        )
 
     def __str__(self) -> str:
-        return f"({self.x}, {self.y}, {self.plane})"
+        return f"({self & 0x7FFF}, {(self >> 15) & 0x7FFF}, {(self >> 30) & 0x3})"
 
 
 def packPosition(x: int, y: int, plane: int) -> int:
@@ -188,3 +305,57 @@ def unpackPosition(packed: int) -> Tuple[int, int, int]:
     plane = (packed >> 30) & 0x3  # 2 bits (30-31)
 
     return (x, y, plane)
+
+
+# ---------------------------------------------------------------------------
+# Vectorized pack/unpack
+# ---------------------------------------------------------------------------
+
+
+def packPositions(x, y, plane, validate: bool = True) -> np.ndarray:
+    """
+    Pack arrays of (x, y, plane) into 32-bit unsigned integers (vectorized).
+
+    Args:
+        x: X coordinates (0-32767), array-like
+        y: Y coordinates (0-32767), array-like
+        plane: Plane levels (0-3), array-like or scalar
+        validate: If False, skip range checks and mask out-of-range bits
+            like packPosition() does (for trusted data)
+
+    Returns:
+        uint32 array of packed positions
+
+    Example:
+        >>> packPositions([3200, 3201], [3200, 3200], 0)
+        array([104860800, 104860801], dtype=uint32)
+    """
+    x = np.asarray(x, dtype=np.int64)
+    y = np.asarray(y, dtype=np.int64)
+    plane = np.asarray(plane, dtype=np.int64)
+
+    if validate and (((x | y) & ~0x7FFF).any() or (plane & ~0x3).any()):
+        raise ValueError("Coordinates out of range (x/y must be 0-32767, plane 0-3)")
+
+    packed = (x & 0x7FFF) | ((y & 0x7FFF) << 15) | ((plane & 0x3) << 30)
+    return packed.astype(np.uint32)
+
+
+def unpackPositions(packed) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Unpack an array of 32-bit integers into (x, y, plane) arrays (vectorized).
+
+    Args:
+        packed: Packed positions (signed or unsigned), array-like
+
+    Returns:
+        Tuple of int32 arrays (x, y, plane)
+    """
+    # Reinterpret signed values as unsigned for bit operations
+    packed = np.asarray(packed).astype(np.uint32, copy=False)
+
+    x = (packed & 0x7FFF).astype(np.int32)
+    y = ((packed >> 15) & 0x7FFF).astype(np.int32)
+    plane = (packed >> 30).astype(np.int32)
+
+    return (x, y, plane)
@@ -277,16 +277,12 @@ class Path:
             return []
 
         sceneX, sceneY, inScene = self.getSceneCoords()
-        indices = np.where(inScene)[0]
 
-        quads = []
-        for i in indices:
-            sx, sy = sceneX[i], sceneY[i]
-            tileIdx = sx * grid.sizeY + sy
-            if grid.tileOnScreen[tileIdx]:
-                quads.append(grid.getTileQuad(tileIdx))
+        # Vectorized tile index + on-screen filter; only visible tiles reach Python
+        tileIdx = sceneX[inScene] * grid.sizeY + sceneY[inScene]
+        tileIdx = tileIdx[grid.tileOnScreen[tileIdx]]
 
-        return quads
+        return [grid.getTileQuad(t) for t in tileIdx.tolist()]
 
     def getScreenPoint(self, i: int) -> "Point | None":
         """
@@ -392,8 +388,8 @@ class Path:
         Returns:
             Next tile or None if at end
         """
-        # Vectorized search
-        matches = np.where(self._packed == current.packed)[0]
+        # Vectorized search; compare as unsigned since PackedPosition.packed is unsigned
+        matches = np.where(self._packed.view(np.uint32) == current.packed)[0]
         if len(matches) == 0:
             return None
         idx = matches[0]
@@ -500,7 +496,7 @@ class Path:
         newPacked = self._packed[startIdx:]
 
         # Filter obstacles that are still ahead
-        remainingPositions = set(newPacked.tolist())
+        remainingPositions = set(newPacked.view(np.uint32).tolist())
         newObstacles = [obs for obs in self._obstacles if obs.origin.packed in remainingPositions]
 
         return Path(newPacked, newObstacles)
@@ -1,10 +1,15 @@
 """Point geometry types for 2D and 3D coordinates."""
 
 import math
+import operator
 from dataclasses import dataclass
 
+import numpy as np
 
-@dataclass
+from shadowlib.types.shared import getMouse
+
+
+@dataclass(slots=True)
 class Point:
     """
     Represents a 2D point with integer coordinates.
@@ -37,9 +42,86 @@ class Point:
             >>> p2 = Point(3, 4)
             >>> p1.distanceTo(p2)  # Returns 5.0
         """
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+    def distanceSqTo(self, other: "Point") -> int:
+        """
+        Calculate squared Euclidean distance to another point.
+
+        Cheaper than distanceTo() when only comparing distances, e.g.
+        against a squared radius.
+
+        Args:
+            other: Another Point instance
+
+        Returns:
+            Squared distance as an int
+
+        Example:
+            >>> Point(0, 0).distanceSqTo(Point(3, 4))  # Returns 25
+        """
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy
+
+    def isWithinRadius(self, other: "Point", radius: float) -> bool:
+        """
+        Check if another point is within a Euclidean radius of this one.
+
+        Compares squared distances, so no sqrt is taken.
+
+        Args:
+            other: Another Point instance
+            radius: Maximum distance
+
+        Returns:
+            True if the distance to other is at most radius
+
+        Example:
+            >>> Point(0, 0).isWithinRadius(Point(3, 4), 5)  # True
+        """
+        dx = self.x - other.x
+        dy = self.y - other.y
+        return dx * dx + dy * dy <= radius * radius
+
+    def chebyshevTo(self, other: "Point") -> int:
+        """
+        Calculate Chebyshev (king-move) distance to another point.
+
+        Matches tile distance in OSRS, without the sqrt of distanceTo().
+
+        Args:
+            other: Another Point instance
+
+        Returns:
+            Distance as an int (max of |dx|, |dy|)
+
+        Example:
+            >>> Point(0, 0).chebyshevTo(Point(3, 4))  # Returns 4
+        """
         dx = self.x - other.x
         dy = self.y - other.y
-        return math.sqrt(dx * dx + dy * dy)
+        if dx < 0:
+            dx = -dx
+        if dy < 0:
+            dy = -dy
+        return dx if dx > dy else dy
+
+    def distancesToMany(self, xs, ys) -> np.ndarray:
+        """
+        Calculate Euclidean distances to many points at once (vectorized).
+
+        Args:
+            xs: X coordinates, array-like
+            ys: Y coordinates, array-like
+
+        Returns:
+            float64 array of distances, one per (x, y) pair
+
+        Example:
+            >>> Point(0, 0).distancesToMany([3, 6], [4, 8])  # array([ 5., 10.])
+        """
+        return np.hypot(np.asarray(xs) - self.x, np.asarray(ys) - self.y)
 
     def click(self, button: str = "left") -> None:
         """
@@ -53,9 +135,7 @@ class Point:
             >>> point.click()  # Left click
             >>> point.click(button="right")  # Right click
         """
-        from shadowlib.globals import getClient
-
-        mouse = getClient().input.mouse
+        mouse = getMouse()
         if button == "left":
             mouse.leftClick(self.x, self.y)
         else:
@@ -69,10 +149,7 @@ class Point:
             >>> point = Point(100, 200)
             >>> point.hover()
         """
-        from shadowlib.globals import getClient
-
-        mouse = getClient().input.mouse
-        mouse.moveTo(self.x, self.y)
+        getMouse().moveTo(self.x, self.y)
 
     def rightClick(self) -> None:
         """
@@ -111,7 +188,7 @@ class Point:
         drawing.addLine(self.x, self.y - size, self.x, self.y + size, argbColor, thickness, tag)
 
 
-@dataclass
+@dataclass(slots=True)
 class Point3D:
     """
     Represents a 3D point with integer coordinates.
@@ -146,10 +223,51 @@ class Point3D:
             >>> p2 = Point3D(3, 4, 0)
             >>> p1.distanceTo(p2)  # Returns 5.0
         """
+        return math.hypot(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def distanceSqTo(self, other: "Point3D") -> int:
+        """
+        Calculate squared 3D Euclidean distance to another point.
+
+        Args:
+            other: Another Point3D instance
+
+        Returns:
+            Squared distance as an int
+
+        Example:
+            >>> Point3D(0, 0, 0).distanceSqTo(Point3D(3, 4, 0))  # Returns 25
+        """
         dx = self.x - other.x
         dy = self.y - other.y
         dz = self.z - other.z
-        return math.sqrt(dx * dx + dy * dy + dz * dz)
+        return dx * dx + dy * dy + dz * dz
+
+    def chebyshevTo(self, other: "Point3D") -> int:
+        """
+        Calculate 3D Chebyshev distance to another point.
+
+        Args:
+            other: Another Point3D instance
+
+        Returns:
+            Distance as an int (max of |dx|, |dy|, |dz|)
+
+        Example:
+            >>> Point3D(0, 0, 0).chebyshevTo(Point3D(3, 4, 5))  # Returns 5
+        """
+        dx = self.x - other.x
+        dy = self.y - other.y
+        dz = self.z - other.z
+        if dx < 0:
+            dx = -dx
+        if dy < 0:
+            dy = -dy
+        if dz < 0:
+            dz = -dz
+        if dy > dx:
+            dx = dy
+        return dx if dx > dz else dz
 
     def to2d(self) -> Point:
         """
@@ -166,3 +284,112 @@ class Point3D:
 
     def __repr__(self) -> str:
         return f"Point3D({self.x}, {self.y}, {self.z})"
+
+
+class PointArray:
+    """
+    Collection of 2D points stored as contiguous numpy coordinate arrays.
+
+    Prefer this over a list of Point for bulk distance queries: each
+    query is a single vectorized pass instead of one Python call per point.
+
+    Example:
+        >>> points = PointArray.fromPoints([Point(0, 0), Point(10, 10), Point(3, 4)])
+        >>> idx = points.closestTo(2, 2)  # 2
+        >>> points[idx]  # Point(3, 4)
+    """
+
+    __slots__ = ("_xs", "_ys")
+
+    def __init__(self, xs, ys):
+        """
+        Initialize from coordinate arrays.
+
+        Args:
+            xs: X coordinates, array-like
+            ys: Y coordinates, array-like (same length as xs)
+        """
+        self._xs = np.asarray(xs, dtype=np.int32)
+        self._ys = np.asarray(ys, dtype=np.int32)
+        if self._xs.shape != self._ys.shape:
+            raise ValueError(f"Shape mismatch: xs {self._xs.shape} vs ys {self._ys.shape}")
+
+    @classmethod
+    def fromPoints(cls, points) -> "PointArray":
+        """
+        Create from an iterable of Point instances.
+
+        Args:
+            points: Iterable of Point
+
+        Returns:
+            PointArray instance
+        """
+        points = list(points)
+        n = len(points)
+        xs = np.fromiter((p.x for p in points), dtype=np.int32, count=n)
+        ys = np.fromiter((p.y for p in points), dtype=np.int32, count=n)
+        return cls(xs, ys)
+
+    @property
+    def xs(self) -> np.ndarray:
+        """X coordinates. Shape: [length]."""
+        return self._xs
+
+    @property
+    def ys(self) -> np.ndarray:
+        """Y coordinates. Shape: [length]."""
+        return self._ys
+
+    def distancesSqTo(self, x: int, y: int) -> np.ndarray:
+        """
+        Calculate squared Euclidean distance from each point to (x, y).
+
+        Args:
+            x: Target X coordinate
+            y: Target Y coordinate
+
+        Returns:
+            int64 array of squared distances (same length as the array)
+        """
+        # int64 so squared world-coordinate distances cannot overflow
+        dx = self._xs - np.int64(x)
+        dy = self._ys - np.int64(y)
+        return dx * dx + dy * dy
+
+    def closestTo(self, x: int, y: int) -> int:
+        """
+        Find index of the point closest to (x, y).
+
+        Args:
+            x: Target X coordinate
+            y: Target Y coordinate
+
+        Returns:
+            Index of closest point, or -1 if the array is empty.
+        """
+        if len(self._xs) == 0:
+            return -1
+        return int(self.distancesSqTo(x, y).argmin())
+
+    def __len__(self) -> int:
+        return len(self._xs)
+
+    def __getitem__(self, index: int | slice) -> "Point | PointArray":
+        # Slices share the underlying arrays, like numpy views
+        if isinstance(index, slice):
+            return PointArray(self._xs[index], self._ys[index])
+        try:
+            i = operator.index(index)
+        except TypeError:
+            raise TypeError(
+                f"PointArray indices must be integers or slices, not {type(index).__name__}"
+            ) from None
+        return Point(int(self._xs[i]), int(self._ys[i]))
+
+    def __iter__(self):
+        for x, y in zip(self._xs.tolist(), self._ys.tolist()):
+            yield Point(x, y)
+
+    def __repr__(self) -> str:
+        return f"PointArray({len(self._xs)} points)"
@@ -1,14 +1,14 @@
 """Polygon geometry type."""
 
-import random
+import bisect
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, List
+from typing import List
 
-if TYPE_CHECKING:
-    from shadowlib.types.point import Point
+from shadowlib.types.point import Point
+from shadowlib.types.shared import getMouse, rng
 
 
-@dataclass
+@dataclass(slots=True)
 class Polygon:
     """
     Represents an arbitrary polygon defined by n vertices.
@@ -42,13 +42,22 @@ class Polygon:
             >>> polygon = Polygon([])
             >>> polygon.fromArray([[0, 0], [100, 0], [50, 100]])
         """
-        from shadowlib.types.point import Point
-
         x_data = data[0]
         y_data = data[1]
 
         self.vertices = [Point(x, y) for x, y in zip(x_data, y_data)]
 
+    def _coords(self) -> tuple[list[int], list[int]]:
+        """
+        Get vertex coordinates as separate x and y lists.
+
+        Bulk vertex operations read these flat int lists once instead of
+        going through each Point's attributes repeatedly. Not cached, since
+        vertices may be reassigned or mutated.
+        """
+        vertices = self.vertices
+        return [v.x for v in vertices], [v.y for v in vertices]
+
     def center(self) -> "Point":
         """
         Get the centroid (center of mass) of the polygon.
@@ -60,17 +69,16 @@ class Polygon:
             >>> polygon = Polygon([Point(0, 0), Point(100, 0), Point(50, 100)])
             >>> center = polygon.center()
         """
-        from shadowlib.types.point import Point
-
-        x_sum = sum(v.x for v in self.vertices)
-        y_sum = sum(v.y for v in self.vertices)
-        n = len(self.vertices)
-        return Point(x_sum // n, y_sum // n)
+        xs, ys = self._coords()
+        n = len(xs)
+        return Point(sum(xs) // n, sum(ys) // n)
 
     def bounds(self) -> tuple[int, int, int, int]:
         """
         Get the bounding box of this polygon.
 
+        Maxima are inclusive, like every shape's bounds().
+
         Returns:
             Tuple of (minX, minY, maxX, maxY)
 
@@ -78,11 +86,8 @@ class Polygon:
             >>> polygon = Polygon([Point(0, 0), Point(100, 0), Point(50, 100)])
             >>> bounds = polygon.bounds()  # (0, 0, 100, 100)
         """
-        min_x = min(v.x for v in self.vertices)
-        min_y = min(v.y for v in self.vertices)
-        max_x = max(v.x for v in self.vertices)
-        max_y = max(v.y for v in self.vertices)
-        return (min_x, min_y, max_x, max_y)
+        xs, ys = self._coords()
+        return (min(xs), min(ys), max(xs), max(ys))
 
     def contains(self, point: "Point") -> bool:
         """
@@ -100,19 +105,16 @@ class Polygon:
             >>> polygon.contains(Point(200, 200))  # False
         """
         x, y = point.x, point.y
-        n = len(self.vertices)
         inside = False
 
-        p1x, p1y = self.vertices[0].x, self.vertices[0].y
-        for i in range(1, n + 1):
-            p2x, p2y = self.vertices[i % n].x, self.vertices[i % n].y
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
+        # Walk edges (prev -> v), starting with the closing edge
+        prev = self.vertices[-1]
+        p1x, p1y = prev.x, prev.y
+        for v in self.vertices:
+            p2x, p2y = v.x, v.y
+            # Edge straddles the ray's y (half-open, so p1y != p2y) and the crossing is right of x
+            if (p1y < y) != (p2y < y) and x <= (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x:
+                inside = not inside
             p1x, p1y = p2x, p2y
 
         return inside
@@ -128,17 +130,76 @@ class Polygon:
             >>> polygon = Polygon([Point(0, 0), Point(100, 0), Point(100, 100), Point(0, 100)])
             >>> polygon.area()  # Returns 10000.0
         """
-        n = len(self.vertices)
-        area = 0.0
-        for i in range(n):
-            j = (i + 1) % n
-            area += self.vertices[i].x * self.vertices[j].y
-            area -= self.vertices[j].x * self.vertices[i].y
+        xs, ys = self._coords()
+        area = 0
+        # Walk edges (prev -> cur), starting with the closing edge
+        x1, y1 = xs[-1], ys[-1]
+        for x2, y2 in zip(xs, ys):
+            area += x1 * y2 - x2 * y1
+            x1, y1 = x2, y2
         return abs(area) / 2.0
 
+    def _triangulate(self) -> list[tuple[int, int, int, int, int, int]]:
+        """
+        Split the polygon into triangles by ear clipping.
+
+        Returns:
+            List of triangles as (ax, ay, bx, by, cx, cy) tuples, wound so that
+            each has a non-negative cross product. May not cover the whole
+            polygon if it is self-intersecting.
+        """
+        xs, ys = self._coords()
+        n = len(xs)
+        if n < 3:
+            return []
+
+        # Shoelace sign gives the winding; walk it so that convex corners have cross > 0
+        signed = 0
+        for i in range(n):
+            signed += xs[i - 1] * ys[i] - xs[i] * ys[i - 1]
+        idx = list(range(n)) if signed >= 0 else list(range(n - 1, -1, -1))
+
+        triangles = []
+        while len(idx) > 3:
+            m = len(idx)
+            for i in range(m):
+                a, b, c = idx[i - 1], idx[i], idx[(i + 1) % m]
+                ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]
+                # Reflex or collinear corner: not an ear
+                if (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) <= 0:
+                    continue
+                # An ear contains no other remaining vertex (edges inclusive)
+                for j in idx:
+                    if j in (a, b, c):
+                        continue
+                    px, py = xs[j], ys[j]
+                    if (
+                        (bx - ax) * (py - ay) - (by - ay) * (px - ax) >= 0
+                        and (cx - bx) * (py - by) - (cy - by) * (px - bx) >= 0
+                        and (ax - cx) * (py - cy) - (ay - cy) * (px - cx) >= 0
+                    ):
+                        break
+                else:
+                    triangles.append((ax, ay, bx, by, cx, cy))
+                    del idx[i]
+                    break
+            else:
+                # No ear left (self-intersecting or degenerate input)
+                return triangles
+
+        a, b, c = idx
+        triangles.append((xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]))
+        return triangles
+
     def randomPoint(self) -> "Point":
         """
-        Generate a random point within this polygon using rejection sampling.
+        Generate a uniformly random point within this polygon.
+
+        Tries a few rounds of rejection sampling in the bounding box first,
+        which is cheapest when the polygon fills most of it. Thin or elongated
+        polygons then fall back to picking a triangle of the triangulation
+        weighted by area and sampling it with barycentric coordinates, which
+        doesn't depend on the fill ratio.
 
         Returns:
             Random Point inside the polygon
@@ -148,19 +209,45 @@ class Polygon:
             >>> point = polygon.randomPoint()
         """
         min_x, min_y, max_x, max_y = self.bounds()
-
-        # Rejection sampling with max attempts
-        max_attempts = 1000
-        for _ in range(max_attempts):
-            from shadowlib.types.point import Point
-
-            x = random.randint(min_x, max_x)
-            y = random.randint(min_y, max_y)
-            point = Point(x, y)
-            if self.contains(point):
+        # Bind the per-iteration lookups as locals
+        contains = self.contains
+        randint = rng.randint
+        rand = rng.random
+
+        # Rejection sampling; a short budget since the triangulation handles low fill ratios
+        for _ in range(8):
+            point = Point(randint(min_x, max_x), randint(min_y, max_y))
+            if contains(point):
                 return point
 
-        # Fallback to center if rejection sampling fails
+        triangles = self._triangulate()
+        cumulative = []
+        total = 0
+        for ax, ay, bx, by, cx, cy in triangles:
+            # Twice the triangle area; the common factor cancels in the weighting
+            total += (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+            cumulative.append(total)
+
+        if total > 0:
+            last = len(triangles) - 1
+            for _ in range(100):
+                i = bisect.bisect(cumulative, rand() * total)
+                ax, ay, bx, by, cx, cy = triangles[i if i < last else last]
+                u = rand()
+                v = rand()
+                # Reflect samples from the far half of the parallelogram back into the triangle
+                if u + v > 1:
+                    u = 1 - u
+                    v = 1 - v
+                point = Point(
+                    round(ax + u * (bx - ax) + v * (cx - ax)),
+                    round(ay + u * (by - ay) + v * (cy - ay)),
+                )
+                # Rounding can step just outside along an edge; self-intersecting input can too
+                if contains(point):
+                    return point
+
+        # Fallback to center for degenerate polygons
         return self.center()
 
     def click(self, button: str = "left", randomize: bool = True) -> None:
@@ -193,10 +280,7 @@ class Polygon:
             >>> polygon = Polygon([Point(0, 0), Point(100, 0), Point(50, 100)])
             >>> polygon.hover()  # Hover at random point
         """
-        from shadowlib.globals import getClient
-        from shadowlib.types.point import Point
-
-        current = Point(*getClient().input.mouse.position)
+        current = Point(*getMouse().position)
         if self.contains(current):
             return True
         point = self.randomPoint() if randomize else self.center()
@@ -237,6 +321,5 @@ class Polygon:
         """
         from shadowlib.input.drawing import drawing
 
-        xPoints = [v.x for v in self.vertices]
-        yPoints = [v.y for v in self.vertices]
+        xPoints, yPoints = self._coords()
         drawing.addPolygon(xPoints, yPoints, argbColor, filled, tag)
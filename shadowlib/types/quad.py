@@ -1,14 +1,14 @@
 """Quad (quadrilateral) geometry type - optimized for 4-vertex shapes like tiles."""
 
-import random
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, List
+from typing import List
 
-if TYPE_CHECKING:
-    from shadowlib.types.point import Point
+from shadowlib.types.point import Point
+from shadowlib.types.polygon import Polygon
+from shadowlib.types.shared import getMouse, rng
 
 
-@dataclass
+@dataclass(slots=True)
 class Quad:
     """
     Represents a quadrilateral defined by exactly 4 vertices.
@@ -74,8 +74,6 @@ class Quad:
         Example:
             >>> quad = Quad.fromCoords([(0, 0), (100, 0), (100, 100), (0, 100)])
         """
-        from shadowlib.types.point import Point
-
         if len(coords) != 4:
             raise ValueError(f"Quad requires exactly 4 coordinates, got {len(coords)}")
         points = [Point(x, y) for x, y in coords]
@@ -96,8 +94,6 @@ class Quad:
         Example:
             >>> quad = Quad.fromArrays([0, 100, 100, 0], [0, 0, 100, 100])
         """
-        from shadowlib.types.point import Point
-
         if len(xCoords) != 4 or len(yCoords) != 4:
             raise ValueError("Quad requires exactly 4 x and 4 y coordinates")
         return cls(
@@ -132,8 +128,6 @@ class Quad:
             >>> quad = Quad.fromCoords([(0, 0), (100, 0), (100, 100), (0, 100)])
             >>> center = quad.center()  # Point(50, 50)
         """
-        from shadowlib.types.point import Point
-
         x = (self.p1.x + self.p2.x + self.p3.x + self.p4.x) // 4
         y = (self.p1.y + self.p2.y + self.p3.y + self.p4.y) // 4
         return Point(x, y)
@@ -142,6 +136,8 @@ class Quad:
         """
         Get the axis-aligned bounding box of this quad.
 
+        Maxima are inclusive, like every shape's bounds().
+
         Returns:
             Tuple of (minX, minY, maxX, maxY)
 
@@ -149,24 +145,10 @@ class Quad:
             >>> quad = Quad.fromCoords([(10, 20), (110, 25), (105, 120), (5, 115)])
             >>> bounds = quad.bounds()  # (5, 20, 110, 120)
         """
-        xs = [self.p1.x, self.p2.x, self.p3.x, self.p4.x]
-        ys = [self.p1.y, self.p2.y, self.p3.y, self.p4.y]
-        return (min(xs), min(ys), max(xs), max(ys))
-
-    def _sign(self, p1x: int, p1y: int, p2x: int, p2y: int, p3x: int, p3y: int) -> float:
-        """Helper for cross product sign calculation."""
-        return (p1x - p3x) * (p2y - p3y) - (p2x - p3x) * (p1y - p3y)
-
-    def _pointInTriangle(self, px: int, py: int, v1: "Point", v2: "Point", v3: "Point") -> bool:
-        """Check if point is in triangle using barycentric coordinates."""
-        d1 = self._sign(px, py, v1.x, v1.y, v2.x, v2.y)
-        d2 = self._sign(px, py, v2.x, v2.y, v3.x, v3.y)
-        d3 = self._sign(px, py, v3.x, v3.y, v1.x, v1.y)
-
-        hasNeg = (d1 < 0) or (d2 < 0) or (d3 < 0)
-        hasPos = (d1 > 0) or (d2 > 0) or (d3 > 0)
-
-        return not (hasNeg and hasPos)
+        p1, p2, p3, p4 = self.p1, self.p2, self.p3, self.p4
+        x1, x2, x3, x4 = p1.x, p2.x, p3.x, p4.x
+        y1, y2, y3, y4 = p1.y, p2.y, p3.y, p4.y
+        return (min(x1, x2, x3, x4), min(y1, y2, y3, y4), max(x1, x2, x3, x4), max(y1, y2, y3, y4))
 
     def contains(self, point: "Point") -> bool:
         """
@@ -187,12 +169,24 @@ class Quad:
             >>> quad.contains(Point(200, 200))  # False
         """
         px, py = point.x, point.y
+        x1, y1 = self.p1.x, self.p1.y
+        x2, y2 = self.p2.x, self.p2.y
+        x3, y3 = self.p3.x, self.p3.y
+        x4, y4 = self.p4.x, self.p4.y
 
         # Split quad into two triangles: (p1, p2, p3) and (p1, p3, p4)
-        # Point is in quad if it's in either triangle
-        return self._pointInTriangle(px, py, self.p1, self.p2, self.p3) or self._pointInTriangle(
-            px, py, self.p1, self.p3, self.p4
-        )
+        # Point is in quad if it's in either triangle, i.e. the cross products
+        # against a triangle's edges don't have mixed signs. The diagonal p1-p3
+        # is shared, so its cross product is computed once (negated for the 2nd).
+        d1 = (px - x2) * (y1 - y2) - (x1 - x2) * (py - y2)
+        d2 = (px - x3) * (y2 - y3) - (x2 - x3) * (py - y3)
+        d3 = (px - x1) * (y3 - y1) - (x3 - x1) * (py - y1)
+        if (d1 >= 0 and d2 >= 0 and d3 >= 0) or (d1 <= 0 and d2 <= 0 and d3 <= 0):
+            return True
+
+        d4 = (px - x4) * (y3 - y4) - (x3 - x4) * (py - y4)
+        d5 = (px - x1) * (y4 - y1) - (x4 - x1) * (py - y1)
+        return (d3 <= 0 and d4 >= 0 and d5 >= 0) or (d3 >= 0 and d4 <= 0 and d5 <= 0)
 
     def area(self) -> float:
         """
@@ -229,12 +223,10 @@ class Quad:
             >>> quad = Quad.fromCoords([(0, 0), (100, 0), (100, 100), (0, 100)])
             >>> point = quad.randomPoint()
         """
-        from shadowlib.types.point import Point
-
         # Use bilinear interpolation for efficient random point generation
         # This works well for convex quads and reasonably well for mildly concave ones
-        u = random.random()
-        v = random.random()
+        u = rng.random()
+        v = rng.random()
 
         # Bilinear interpolation between the 4 corners
         # P = (1-u)(1-v)*p1 + u*(1-v)*p2 + u*v*p3 + (1-u)*v*p4
@@ -260,11 +252,11 @@ class Quad:
 
         # For concave quads, use rejection sampling as fallback
         minX, minY, maxX, maxY = self.bounds()
+        contains = self.contains
+        randint = rng.randint
         for _ in range(100):
-            x = random.randint(minX, maxX)
-            y = random.randint(minY, maxY)
-            point = Point(x, y)
-            if self.contains(point):
+            point = Point(randint(minX, maxX), randint(minY, maxY))
+            if contains(point):
                 return point
 
         # Ultimate fallback to center
@@ -300,10 +292,7 @@ class Quad:
             >>> quad = Quad.fromCoords([(0, 0), (100, 0), (100, 100), (0, 100)])
             >>> quad.hover()  # Hover at random point
         """
-        from shadowlib.globals import getClient
-        from shadowlib.types.point import Point
-
-        current = Point(*getClient().input.mouse.position)
+        current = Point(*getMouse().position)
         if self.contains(current):
             return True
         point = self.randomPoint() if randomize else self.center()
@@ -333,8 +322,6 @@ class Quad:
         Example:
             >>> polygon = quad.toPolygon()
         """
-        from shadowlib.types.polygon import Polygon
-
         return Polygon(self.vertices)
 
     def isConvex(self) -> bool:
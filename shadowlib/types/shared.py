@@ -0,0 +1,40 @@
+"""State shared by the geometry types (Point, Box, Circle, Polygon, Quad)."""
+
+import random
+
+# Random source for the shape samplers (randomPoint). A dedicated instance can be
+# seeded for reproducible sampling and isn't perturbed by other users of the
+# global random module (mouse jitter, timing)
+rng = random.Random()
+
+# Mouse singleton, resolved on first click/hover
+_mouse = None
+
+
+def seedRandom(seed: int | None = None) -> None:
+    """
+    Seed the random source used by the shape samplers.
+
+    Args:
+        seed: Seed value, or None to reseed from system entropy
+
+    Example:
+        >>> seedRandom(42)
+        >>> Box(0, 0, 100, 100).randomPoint()  # Same point on every run
+    """
+    rng.seed(seed)
+
+
+def getMouse():
+    """
+    Get the mouse singleton, importing it on first use.
+
+    Returns:
+        The shared Mouse instance
+    """
+    global _mouse
+    if _mouse is None:
+        from shadowlib.input.mouse import mouse
+
+        _mouse = mouse
+    return _mouse
@@ -169,6 +169,9 @@ class Widget:
         w.enable(WidgetFields.getActions)
         data = w.get()
 
+    Several fields can be enabled in one call:
+        w = Widget(widget_id).enable(WidgetFields.getBounds, WidgetFields.getText)
+
     Usage with strings (also valid):
         w = Widget(widget_id)
         w.enable("getBounds")
@@ -190,9 +193,11 @@ class Widget:
         """Return the combined Java bitmask."""
         return self._mask
 
-    def enable(self, field: WidgetField) -> "Widget":
-        """Enable a specific getter flag."""
-        self._mask |= self._FIELD_BITS[field]
+    def enable(self, *fields: WidgetField) -> "Widget":
+        """Enable one or more getter flags."""
+        bits = self._FIELD_BITS
+        for field in fields:
+            self._mask |= bits[field]
         return self
 
     def disable(self, field: WidgetField) -> "Widget":
@@ -215,10 +220,7 @@ class Widget:
     @classmethod
     def fromNames(cls, *fields: WidgetField) -> "Widget":
         """Build a mask in one line."""
-        w = cls()
-        for f in fields:
-            w.enable(f)
-        return w
+        return cls().enable(*fields)
 
     # ---- Debug helpers --------------------------------------------------
 
@@ -68,8 +68,9 @@ class GroundItems:
 
         current_tick = client.cache.tick
 
-        # Return cached if same tick
-        if self._cached_tick == current_tick and self._cached_list.count() > 0:
+        # Return cached if same tick (an empty result is a valid cache hit too).
+        # No tick yet (None) means nothing to key on, so always refresh.
+        if current_tick is not None and self._cached_tick == current_tick:
             return self._cached_list
 
         # Refresh cache
@@ -0,0 +1,170 @@
+"""Tests for the convert_to_camelcase rewrite script."""
+
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from convert_to_camelcase import (  # noqa: E402
+    buildReplacementPattern,
+    buildTrieRegex,
+    collectFunctionNames,
+    replaceFunctionNames,
+)
+
+
+class TestCollectFunctionNames:
+    """Test suite for collectFunctionNames."""
+
+    def testCollectsSnakeCaseDefinitions(self):
+        """Test that snake_case function and method names are collected."""
+        source = (
+            "def get_client():\n"
+            "    pass\n"
+            "\n"
+            "class Bank:\n"
+            "    async def open_bank(self):\n"
+            "        pass\n"
+            "\n"
+            "    def __init__(self):\n"
+            "        pass\n"
+            "\n"
+            "    def deposit(self):\n"
+            "        pass\n"
+        )
+        assert collectFunctionNames(source, "test.py") == {
+            "get_client": "getClient",
+            "open_bank": "openBank",
+        }
+
+    def testIgnoresDefinitionsInsideStrings(self):
+        """Test that def lines inside triple-quoted strings are not collected."""
+        source = (
+            "TEMPLATE = '''\n"
+            "def static_caller(self):\n"
+            "    pass\n"
+            "'''\n"
+            "\n"
+            "def wait_until(condition):\n"
+            '    """\n'
+            "    Example:\n"
+            "        def is_bank_open():\n"
+            "            return True\n"
+            '    """\n'
+        )
+        assert collectFunctionNames(source, "test.py") == {"wait_until": "waitUntil"}
+
+    def testCollectsBackslashContinuedDefinition(self):
+        """Test that a def split with a backslash is collected alongside other defs."""
+        source = "def plain_one():\n    pass\n\ndef \\\n    split_one():\n    pass\n"
+        assert collectFunctionNames(source, "test.py") == {
+            "plain_one": "plainOne",
+            "split_one": "splitOne",
+        }
+
+    def testSkipsFilesWithoutDef(self):
+        """Test that files with no def keyword return no names."""
+        assert collectFunctionNames("x = 1\n", "test.py") == {}
+
+
+class TestReplaceFunctionNames:
+    """Test suite for replaceFunctionNames."""
+
+    REPLACEMENTS = {
+        "get_client": "getClient",
+        "open_bank": "openBank",
+        "cached_prop": "cachedProp",
+        "wait_time": "waitTime",
+    }
+
+    def rewrite(self, tmp_path, source):
+        """Run replaceFunctionNames on a tmp file and return (result, new content)."""
+        path = tmp_path / "module.py"
+        path.write_text(source, encoding="utf-8")
+        result = replaceFunctionNames(path, source, self.REPLACEMENTS)
+        return result, path.read_text(encoding="utf-8")
+
+    def testRenamesDefinitionsAndDecorators(self, tmp_path):
+        """Test def, async def and decorator contexts."""
+        source = (
+            "@cached_prop\ndef get_client():\n    pass\n\nasync def open_bank(self):\n    pass\n"
+        )
+        (count, changes, _), content = self.rewrite(tmp_path, source)
+        assert content == (
+            "@cachedProp\ndef getClient():\n    pass\n\nasync def openBank(self):\n    pass\n"
+        )
+        assert count == 3
+        assert sorted(changes) == [
+            ("cached_prop", "cachedProp", 1),
+            ("get_client", "getClient", 1),
+            ("open_bank", "openBank", 1),
+        ]
+
+    def testRenamesCallsKeywordsAndAssignments(self, tmp_path):
+        """Test method calls, bare calls, keyword arguments and assignments."""
+        source = "self.open_bank()\nget_client(wait_time=1)\nwait_time  =  5\n"
+        (count, changes, _), content = self.rewrite(tmp_path, source)
+        # Whitespace around = is preserved
+        assert content == "self.openBank()\ngetClient(waitTime=1)\nwaitTime  =  5\n"
+        assert sorted(changes) == [
+            ("get_client", "getClient", 1),
+            ("open_bank", "openBank", 1),
+            ("wait_time", "waitTime", 2),
+        ]
+
+    def testLeavesComparisonsAndLongerNamesUnchanged(self, tmp_path):
+        """Test that == comparisons and names sharing a prefix are not rewritten."""
+        source = "if get_client == other:\n    get_client_id = get_clients()\n"
+        (count, changes, digest), content = self.rewrite(tmp_path, source)
+        assert content == source
+        assert (count, changes) == (0, [])
+        assert digest is not None
+
+    def testUsesProvidedDigest(self, tmp_path):
+        """Test that a digest from collection is used instead of re-hashing the content."""
+        path = tmp_path / "module.py"
+        source = "get_client()\n"
+        path.write_text(source, encoding="utf-8")
+
+        result = replaceFunctionNames(
+            path, source, self.REPLACEMENTS, clean_hashes=frozenset({"known"}), digest="known"
+        )
+
+        assert result == (0, [], "known")
+        assert path.read_text(encoding="utf-8") == source
+
+
+class TestTrieRegex:
+    """Test suite for buildTrieRegex and the replacement pattern built on it."""
+
+    REPLACEMENTS = {
+        "a_b": "aB",
+        "a_b_c": "aBC",
+        "a_bc": "aBc",
+        "get_api": "getApi",
+        "get_api_key": "getApiKey",
+    }
+
+    def testMatchesOnlyWholeNames(self):
+        """Test that overlapping names match only as whole words, longest first."""
+        pattern = re.compile(rf"\b(?:{buildTrieRegex(self.REPLACEMENTS)})\b")
+
+        for name in self.REPLACEMENTS:
+            assert pattern.fullmatch(name)
+        text = "a_b a_b_c a_bc get_api get_api_key a_b_cd get_apis x_a_b a_"
+        assert pattern.findall(text) == ["a_b", "a_b_c", "a_bc", "get_api", "get_api_key"]
+
+    def testEachNameMapsToItsReplacement(self, tmp_path):
+        """Test that each overlapping name is rewritten to its own replacement."""
+        path = tmp_path / "module.py"
+        source = "a_b()\na_b_c()\na_bc()\nget_api()\nget_api_key()\nget_api_keys()\na_b_cd()\n"
+        path.write_text(source, encoding="utf-8")
+
+        replaceFunctionNames(
+            path, source, self.REPLACEMENTS, pattern=buildReplacementPattern(self.REPLACEMENTS)
+        )
+
+        assert path.read_text(encoding="utf-8") == (
+            "aB()\naBC()\naBc()\ngetApi()\ngetApiKey()\nget_api_keys()\na_b_cd()\n"
+        )
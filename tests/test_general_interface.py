@@ -0,0 +1,76 @@
+"""Tests for GeneralInterface scrolling."""
+
+import pytest
+
+from shadowlib.types.box import Box
+from shadowlib.types.interfaces.general_interface import GeneralInterface
+
+SCROLLBOX = Box(0, 0, 100, 100)
+VISIBLE = {"bounds": (10, 10, 20, 20)}
+BELOW = {"bounds": (10, 150, 20, 20)}
+
+
+@pytest.fixture
+def interface():
+    """Provide a GeneralInterface without building its button widgets."""
+    iface = GeneralInterface.__new__(GeneralInterface)
+    iface.max_scroll = 3
+    return iface
+
+
+def stubWidgets(monkeypatch, widgets):
+    """
+    Make _findWidget return each of widgets in turn, and count scrolls.
+
+    Returns:
+        Dict with "find" and "scroll" call counts and the "up" flag of each scroll
+    """
+    calls = {"find": 0, "scroll": 0, "up": []}
+    remaining = iter(widgets)
+
+    def findWidget(self, text, idx):
+        calls["find"] += 1
+        return next(remaining)
+
+    def scroll(self, sb, up=False):
+        calls["scroll"] += 1
+        calls["up"].append(up)
+
+    monkeypatch.setattr(GeneralInterface, "_findWidget", findWidget)
+    monkeypatch.setattr(GeneralInterface, "_scroll", scroll)
+    return calls
+
+
+class TestMakeVisible:
+    """Test suite for GeneralInterface._makeVisible."""
+
+    def testVisibleWidgetNeedsNoScroll(self, interface, monkeypatch):
+        """Test that an already visible widget is returned without scrolling."""
+        calls = stubWidgets(monkeypatch, [VISIBLE])
+
+        assert interface._makeVisible("", 0, SCROLLBOX) == Box(10, 10, 30, 30)
+        assert calls["scroll"] == 0
+
+    def testScrollsUntilVisible(self, interface, monkeypatch):
+        """Test that the widget is re-fetched after each scroll until it is visible."""
+        calls = stubWidgets(monkeypatch, [BELOW, BELOW, VISIBLE])
+
+        assert interface._makeVisible("", 0, SCROLLBOX) == Box(10, 10, 30, 30)
+        assert calls["find"] == 3
+        assert calls["scroll"] == 2
+        assert calls["up"] == [False, False]
+
+    def testScrollCountIsCappedAtMaxScroll(self, interface, monkeypatch):
+        """Test that a widget that never becomes visible scrolls at most max_scroll times."""
+        calls = stubWidgets(monkeypatch, [BELOW] * (interface.max_scroll + 1))
+
+        assert interface._makeVisible("", 0, SCROLLBOX) is None
+        assert calls["find"] == interface.max_scroll + 1
+        assert calls["scroll"] == interface.max_scroll
+
+    def testWidgetDisappearingAfterScrollReturnsNone(self, interface, monkeypatch):
+        """Test that a widget vanishing after a scroll returns None instead of raising."""
+        calls = stubWidgets(monkeypatch, [BELOW, None])
+
+        assert interface._makeVisible("", 0, SCROLLBOX) is None
+        assert calls["scroll"] == 1
@@ -0,0 +1,69 @@
+"""Tests for GroundItems tick caching."""
+
+import pytest
+
+from shadowlib.world.ground_items import GroundItems
+
+
+class FakeCache:
+    """Event cache stub that counts ground item fetches."""
+
+    def __init__(self, tick, groundItems):
+        self.tick = tick
+        self.groundItems = groundItems
+        self.calls = 0
+
+    def getGroundItems(self):
+        self.calls += 1
+        return self.groundItems
+
+
+class FakeClient:
+    """Client stub exposing only the event cache."""
+
+    def __init__(self, cache):
+        self.cache = cache
+
+
+@pytest.fixture
+def groundItems(monkeypatch):
+    """Provide a fresh GroundItems instance, bypassing the shared singleton."""
+    monkeypatch.setattr(GroundItems, "_instance", None)
+    return GroundItems()
+
+
+class TestGroundItemsCache:
+    """Test suite for GroundItems.getAllItems caching."""
+
+    def testEmptyResultIsCachedWithinTick(self, groundItems, monkeypatch):
+        """Test that a second call in the same tick with no items skips the client."""
+        cache = FakeCache(tick=100, groundItems={})
+        monkeypatch.setattr("shadowlib.client.client", FakeClient(cache))
+
+        first = groundItems.getAllItems()
+        second = groundItems.getAllItems()
+
+        assert cache.calls == 1
+        assert second is first
+        assert first.count() == 0
+
+    def testNewTickRefreshes(self, groundItems, monkeypatch):
+        """Test that the cache refreshes once the tick advances."""
+        cache = FakeCache(tick=100, groundItems={})
+        monkeypatch.setattr("shadowlib.client.client", FakeClient(cache))
+
+        groundItems.getAllItems()
+        cache.tick = 101
+        groundItems.getAllItems()
+
+        assert cache.calls == 2
+
+    def testMissingTickAlwaysRefreshes(self, groundItems, monkeypatch):
+        """Test that calls without a tick (None) are never served from cache."""
+        cache = FakeCache(tick=None, groundItems={})
+        monkeypatch.setattr("shadowlib.client.client", FakeClient(cache))
+
+        groundItems.getAllItems()
+        groundItems.getAllItems()
+
+        assert cache.calls == 2
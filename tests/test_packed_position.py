@@ -0,0 +1,150 @@
+"""Tests for PackedPosition."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from shadowlib.types.packed_position import (
+    PackedPosition,
+    packPosition,
+    packPositions,
+    packPositionSigned,
+    unpackPositions,
+)
+from shadowlib.types.path import Path
+
+
+class TestPackedPosition:
+    """Test suite for PackedPosition."""
+
+    def testFromPackedNormalizesSigned(self):
+        """Test that signed packs (planes 2-3) equal the unsigned position."""
+        signed = packPositionSigned(3200, 3201, 3)
+        assert signed < 0
+
+        position = PackedPosition.fromPacked(signed)
+        assert position == PackedPosition(3200, 3201, 3)
+        assert hash(position) == hash(PackedPosition(3200, 3201, 3))
+        assert position.unpack() == (3200, 3201, 3)
+
+    def testFromPackedAcceptsNumpyScalars(self):
+        """Test that NumPy int32/uint32 scalars (e.g. path.packed[i]) are accepted."""
+        for plane in range(4):
+            signed = np.array([packPositionSigned(3200, 3200, plane)], dtype=np.int32)
+            unsigned = signed.astype(np.uint32)
+            expected = PackedPosition(3200, 3200, plane)
+
+            assert PackedPosition.fromPacked(signed[0]) == expected
+            assert PackedPosition.fromPacked(unsigned[0]) == expected
+            assert type(PackedPosition.fromPacked(signed[0]).packed) is int
+
+    def testPlane3RoundTripThroughPath(self):
+        """Test array round trips for a plane-3 path stored as signed int32."""
+        expected = [PackedPosition(3200, 3200 + i, 3) for i in range(3)]
+        path = Path(np.array([packPositionSigned(3200, 3200 + i, 3) for i in range(3)]), [])
+
+        assert list(path) == expected
+        assert PackedPosition.fromArray(path.packed)[0] == path[0]
+
+        arr = PackedPosition.toArray(list(path))
+        assert arr.dtype == np.uint32
+        assert PackedPosition.fromArray(arr) == expected
+        assert path.getNextTile(expected[0]) == expected[1]
+
+    def testPickleRoundTrip(self):
+        """Test that pickling preserves the position."""
+        position = PackedPosition(3200, 3201, 3)
+        assert pickle.loads(pickle.dumps(position)) == position
+
+
+class TestVectorizedPacking:
+    """Test suite for packPositions/unpackPositions."""
+
+    def testRoundTrip(self):
+        """Test that unpacking packed arrays returns the original coordinates."""
+        x = np.array([0, 3200, 32767, 1])
+        y = np.array([0, 3201, 32767, 2])
+        plane = np.array([0, 1, 2, 3])
+
+        packed = packPositions(x, y, plane)
+        assert packed.dtype == np.uint32
+        assert packed.tolist() == [packPosition(*p) for p in zip(x, y, plane)]
+
+        ux, uy, uplane = unpackPositions(packed)
+        assert ux.tolist() == x.tolist()
+        assert uy.tolist() == y.tolist()
+        assert uplane.tolist() == plane.tolist()
+
+    def testUnpackSignedMatchesUnsigned(self):
+        """Test that signed int32 packs (planes 2-3) unpack like their unsigned form."""
+        signed = np.array([packPositionSigned(3200, 3201, p) for p in range(4)], dtype=np.int32)
+        x, y, plane = unpackPositions(signed)
+        assert x.tolist() == [3200] * 4
+        assert y.tolist() == [3201] * 4
+        assert plane.tolist() == [0, 1, 2, 3]
+
+    @pytest.mark.parametrize(
+        ("x", "y", "plane"),
+        [([-1], [0], 0), ([32768], [0], 0), ([0], [32768], 0), ([0], [0], 4), ([0], [0], -1)],
+    )
+    def testValidateRejectsOutOfRange(self, x, y, plane):
+        """Test that validate=True raises on out-of-range coordinates or planes."""
+        with pytest.raises(ValueError):
+            packPositions(x, y, plane)
+
+    def testUnvalidatedMasksLikePackPosition(self):
+        """Test that validate=False masks out-of-range bits like packPosition."""
+        packed = packPositions([32768 + 5], [40000], 5, validate=False)
+        assert packed.tolist() == [packPosition(32768 + 5, 40000, 5)]
+
+
+def makePositions(count=300, seed=0):
+    """Build random positions around (3200, 3200) on every plane."""
+    rng = np.random.default_rng(seed)
+    xs = rng.integers(3180, 3221, count).tolist()
+    ys = rng.integers(3180, 3221, count).tolist()
+    planes = rng.integers(0, 4, count).tolist()
+    return [PackedPosition(x, y, p) for x, y, p in zip(xs, ys, planes)]
+
+
+def asArray(positions, signed):
+    """Pack positions as uint32, or as signed int32 like Path stores them."""
+    if signed:
+        return np.array([packPositionSigned(*p.unpack()) for p in positions], dtype=np.int32)
+    return np.array(positions, dtype=np.uint32)
+
+
+class TestNearbyMask:
+    """Test suite for PackedPosition.nearbyMask."""
+
+    @pytest.mark.parametrize("signed", [False, True])
+    @pytest.mark.parametrize("samePlane", [True, False])
+    @pytest.mark.parametrize("centerPlane", [0, 2, 3])
+    def testMatchesIsNearby(self, signed, samePlane, centerPlane):
+        """Test that nearbyMask agrees element-wise with scalar isNearby."""
+        positions = makePositions()
+        center = PackedPosition(3200, 3200, centerPlane)
+
+        for radius in (0, 5, 15):
+            mask = PackedPosition.nearbyMask(
+                asArray(positions, signed), center, radius, same_plane=samePlane
+            )
+            expected = [center.isNearby(p, radius, same_plane=samePlane) for p in positions]
+            assert mask.tolist() == expected
+
+
+class TestDistancesToMany:
+    """Test suite for PackedPosition.distancesToMany."""
+
+    @pytest.mark.parametrize("signed", [False, True])
+    @pytest.mark.parametrize("centerPlane", [0, 3])
+    def testMatchesDistanceTo(self, signed, centerPlane):
+        """Test that distancesToMany agrees element-wise with scalar distanceTo."""
+        positions = makePositions()
+        center = PackedPosition(3200, 3200, centerPlane)
+
+        distances = center.distancesToMany(asArray(positions, signed))
+
+        assert distances.dtype == np.int32
+        assert distances.tolist() == [center.distanceTo(p) for p in positions]
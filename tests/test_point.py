@@ -0,0 +1,31 @@
+"""Tests for the Point geometry types."""
+
+import pytest
+
+from shadowlib.types.point import Point, PointArray
+
+
+class TestPointArray:
+    """Test suite for PointArray."""
+
+    def testIndexReturnsPoint(self):
+        """Test that integer indexing returns a Point, including negative indices."""
+        points = PointArray.fromPoints([Point(0, 0), Point(10, 10), Point(3, 4)])
+        assert points[2] == Point(3, 4)
+        assert points[-1] == Point(3, 4)
+
+    def testSliceReturnsPointArray(self):
+        """Test that slicing returns a PointArray of the selected points."""
+        points = PointArray.fromPoints([Point(0, 0), Point(10, 10), Point(3, 4)])
+        sliced = points[1:]
+        assert isinstance(sliced, PointArray)
+        assert list(sliced) == [Point(10, 10), Point(3, 4)]
+        assert sliced.closestTo(2, 2) == 1
+
+    def testNonIntegerIndexRaises(self):
+        """Test that non-integer indices raise a clear TypeError."""
+        points = PointArray.fromPoints([Point(0, 0)])
+        with pytest.raises(TypeError, match="PointArray indices must be integers"):
+            points[0.5]
+        with pytest.raises(TypeError, match="PointArray indices must be integers"):
+            points["0"]
@@ -0,0 +1,98 @@
+"""Tests for the shape geometry types (Box, Circle, Polygon, Quad)."""
+
+from shadowlib.types.box import Box
+from shadowlib.types.circle import Circle
+from shadowlib.types.point import Point
+from shadowlib.types.polygon import Polygon
+from shadowlib.types.quad import Quad
+from shadowlib.types.shared import seedRandom
+
+
+def makeShapes():
+    """Build one of each shape type."""
+    return [
+        Box(0, 0, 50, 50),
+        Circle(50, 50, 20),
+        Polygon([Point(0, 0), Point(100, 100), Point(100, 103), Point(0, 3)]),
+        Quad.fromCoords([(0, 0), (100, 0), (100, 100), (0, 100)]),
+    ]
+
+
+class TestShapeSampling:
+    """Test suite for shape randomPoint sampling."""
+
+    def testSeedRandomMakesSamplingReproducible(self):
+        """Test that seeding gives the same sequence of points for every shape."""
+        shapes = makeShapes()
+
+        seedRandom(7)
+        first = [shape.randomPoint() for shape in shapes for _ in range(20)]
+        seedRandom(7)
+        second = [shape.randomPoint() for shape in shapes for _ in range(20)]
+
+        assert first == second
+
+    def testRandomPointsAreInside(self):
+        """Test that sampled points fall inside their shape."""
+        seedRandom(1)
+        for shape in makeShapes():
+            for _ in range(200):
+                assert shape.contains(shape.randomPoint())
+
+
+class TestShapeBounds:
+    """Test suite for the shared bounds() convention (inclusive maxima)."""
+
+    def testBoxBoundsMatchContainsEdge(self):
+        """Test that Box bounds stop at the last pixel contains() accepts."""
+        box = Box(0, 0, 10, 10)
+        assert box.bounds() == (0, 0, 9, 9)
+        assert box.contains(Point(9, 9))
+        assert not box.contains(Point(10, 10))
+
+    def testSharedEdgePixelIsWithinBounds(self):
+        """Test that a Box and a Quad sharing an edge pixel both report it inclusively."""
+        box = Box(0, 0, 11, 11)
+        quad = Quad.fromCoords([(0, 0), (10, 0), (10, 10), (0, 10)])
+        edge = Point(10, 10)
+
+        for shape in (box, quad):
+            minX, minY, maxX, maxY = shape.bounds()
+            assert shape.contains(edge)
+            assert (maxX, maxY) == (edge.x, edge.y)
+
+    def testContainedPointsLieWithinBounds(self):
+        """Test that every contained grid point is within each shape's inclusive bounds."""
+        for shape in makeShapes():
+            minX, minY, maxX, maxY = shape.bounds()
+            for x in range(-5, 110):
+                for y in range(-5, 110):
+                    if shape.contains(Point(x, y)):
+                        assert minX <= x <= maxX and minY <= y <= maxY
+
+
+class TestBoxIntersection:
+    """Test suite for Box.intersection."""
+
+    def testOverlap(self):
+        """Test that partially overlapping boxes give the shared region."""
+        assert Box(0, 0, 100, 100).intersection(Box(50, 60, 150, 160)) == Box(50, 60, 100, 100)
+        assert Box(50, 60, 150, 160).intersection(Box(0, 0, 100, 100)) == Box(50, 60, 100, 100)
+
+    def testContainment(self):
+        """Test that a box inside another intersects to itself."""
+        inner = Box(20, 20, 40, 40)
+        assert Box(0, 0, 100, 100).intersection(inner) == inner
+        assert inner.intersection(Box(0, 0, 100, 100)) == inner
+
+    def testTouchingEdgesDoNotIntersect(self):
+        """Test that boxes sharing only an edge or corner don't overlap (half-open boxes)."""
+        box = Box(0, 0, 10, 10)
+        assert box.intersection(Box(10, 0, 20, 10)) is None
+        assert box.intersection(Box(0, 10, 10, 20)) is None
+        assert box.intersection(Box(10, 10, 20, 20)) is None
+
+    def testDisjoint(self):
+        """Test that separated boxes don't intersect."""
+        assert Box(0, 0, 10, 10).intersection(Box(20, 20, 30, 30)) is None
+        assert Box(0, 0, 10, 10).intersection(Box(0, 20, 10, 30)) is None